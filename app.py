@@ -1,19 +1,92 @@
 """Main launcher application using Tkinter (standard library)."""
 
+import collections
 import os
+import shlex
+from functools import partial
 from pathlib import Path
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext, filedialog
+from tkinter import ttk, messagebox, filedialog
 from config import ConfigManager, get_app_dir
 from runner import ProcessRunner
 
 # Constants
 LOG_SEPARATOR = "=" * 50
 
+# Log message templates built once at import time
+_START_HEADER = "\n" + LOG_SEPARATOR + "\nUruchamianie {name}...\n" + LOG_SEPARATOR + "\n"
+_STOP_LINE = "\n[ZATRZYMANO] {name} zostało zatrzymane przez użytkownika.\n"
+
+
+def _is_abs_path(path: str) -> bool:
+    """Check whether a path is absolute without the os.path call overhead.
+
+    Args:
+        path: The path string to test.
+
+    Returns:
+        True if the path is absolute (POSIX root or Windows drive/UNC).
+    """
+    return path.startswith(("/", "\\")) or (len(path) > 1 and path[1] == ":")
+
+
+class LogText(tk.Text):
+    """Read-only Text widget tuned for streaming log output.
+
+    Wraps a plain tk.Text plus a ttk.Scrollbar in a frame, with the
+    undo/autoseparator machinery and word wrapping disabled so each
+    insert does minimal work in the Tk core. Drop-in replacement for
+    scrolledtext.ScrolledText.
+    """
+
+    def __init__(self, master=None, **kwargs):
+        """Initialize the log text widget.
+
+        Args:
+            master: The parent widget.
+            **kwargs: Additional Text widget options.
+        """
+        self.frame = ttk.Frame(master)
+        self.vbar = ttk.Scrollbar(self.frame)
+        self.vbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        kwargs.update(
+            wrap=tk.NONE,
+            undo=False,
+            autoseparators=False,
+            maxundo=0,
+            blockcursor=False,
+            tabs=(),
+            spacing1=0,
+            spacing2=0,
+            spacing3=0,
+            yscrollcommand=self.vbar.set
+        )
+        super().__init__(self.frame, **kwargs)
+        self.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.vbar.config(command=self.yview)
+
+        # Copy geometry methods of self.frame without overriding Text methods
+        # (same approach as tkinter.scrolledtext.ScrolledText).
+        text_meths = vars(tk.Text).keys()
+        methods = vars(tk.Pack).keys() | vars(tk.Grid).keys() | vars(tk.Place).keys()
+        for m in methods.difference(text_meths):
+            if m[0] != "_" and m not in ("config", "configure"):
+                setattr(self, m, getattr(self.frame, m))
+
+    def __str__(self):
+        return str(self.frame)
+
 
 class LauncherApp:
     """Main launcher application class using Tkinter."""
 
+    # Watchdog cadence (ms). Output delivery is event-driven on every
+    # platform (<<LogData>> fired by the runner's reader); this loop only
+    # detects process exit and catches stale widgets up.
+    _ACTIVE_POLL_MS = 50   # while a script is running
+    _IDLE_POLL_MS = 500    # idle watchdog
+
     def __init__(self, root: tk.Tk):
         """Initialize the launcher application.
 
@@ -26,13 +99,30 @@ class LauncherApp:
         self.root.minsize(600, 400)
 
         self.config = ConfigManager()
-        self.runner = ProcessRunner(python_executable=self.config.python_executable)
+        self.runner = ProcessRunner(
+            python_executable=self.config.python_executable,
+            on_data=self._notify_log_data
+        )
+        self.app_dir = get_app_dir()
 
         self.current_script = None
-        self.log_content = ""
+        # Cache the line limit so the hot append path avoids a config lookup;
+        # refreshed whenever the configuration window saves.
+        self._log_max_lines = self.config.get("log_max_lines", 1000)
+        # Ring buffer of complete log lines plus the trailing partial line;
+        # bounds memory and makes truncation O(1) per evicted line.
+        self._log_lines = collections.deque(maxlen=self._log_max_lines)
+        self._log_partial = ""
+        self._displayed_lines = 0
+        self._scroll_pending = False
+        self._widget_stale = False
+        self._after_id = None
         self.entry_buttons = []
+        self._entries_fingerprint = ()
+        self._resolved_entries = []
 
         self._create_widgets()
+        self.root.bind("<<LogData>>", self._flush_log)
         self._start_update_loop()
 
         # Handle window close
@@ -102,14 +192,14 @@ class LauncherApp:
         log_label.pack(anchor=tk.W)
 
         # Log text area with scrollbar
-        self.log_text = scrolledtext.ScrolledText(
+        self.log_text = LogText(
             self.main_frame,
             height=15,
             font=("Courier New", 9),
-            state=tk.DISABLED,
-            wrap=tk.WORD
+            state=tk.DISABLED
         )
         self.log_text.pack(fill=tk.BOTH, expand=True, pady=5)
+        self.log_text.bind("<Map>", self._on_log_visible)
 
         # Bottom frame
         bottom_frame = ttk.Frame(self.main_frame)
@@ -123,36 +213,82 @@ class LauncherApp:
         )
         self.btn_clear.pack(side=tk.LEFT)
 
-        # Status label
+        # Status label backed by a StringVar so updates are coalesced by Tk
+        self.status_var = tk.StringVar(value="Status: Gotowy")
         self.status_label = ttk.Label(
             bottom_frame,
-            text="Status: Gotowy",
+            textvariable=self.status_var,
             font=("Helvetica", 10)
         )
         self.status_label.pack(side=tk.RIGHT)
 
     def _refresh_entry_buttons(self) -> None:
         """Refresh the dynamic entry buttons from config entries."""
-        # Clear existing buttons
-        for btn in self.entry_buttons:
-            btn.destroy()
-        self.entry_buttons.clear()
-
-        # Create buttons from entries
         entries = self.config.entries
-        styles = ["Green.TButton", "Blue.TButton"]
-
-        for i, entry in enumerate(entries):
-            style = styles[i % len(styles)]
-            btn = ttk.Button(
-                self.button_frame,
-                text=entry.get("name", f"Entry {i+1}"),
-                command=lambda idx=i: self._on_entry_click(idx),
-                width=15,
-                style=style
+        self._resolve_entries(entries)
+        fingerprint = tuple(
+            entry.get("name", f"Entry {i+1}") for i, entry in enumerate(entries)
+        )
+
+        # Skip the expensive destroy/recreate cycle when nothing changed.
+        if fingerprint == self._entries_fingerprint:
+            return
+
+        if len(fingerprint) == len(self.entry_buttons):
+            # Same button count: update the labels in place.
+            for btn, name in zip(self.entry_buttons, fingerprint):
+                btn.config(text=name)
+        else:
+            # Entry count changed: rebuild the button row.
+            for btn in self.entry_buttons:
+                btn.destroy()
+            self.entry_buttons.clear()
+
+            styles = ["Green.TButton", "Blue.TButton"]
+            for i, name in enumerate(fingerprint):
+                btn = ttk.Button(
+                    self.button_frame,
+                    text=name,
+                    command=partial(self._on_entry_click, i),
+                    width=15,
+                    style=styles[i % len(styles)]
+                )
+                btn.pack(side=tk.LEFT, padx=5)
+                self.entry_buttons.append(btn)
+
+        self._entries_fingerprint = fingerprint
+
+    def _resolve_entries(self, entries: list) -> None:
+        """Pre-compute absolute script/working-dir paths for all entries.
+
+        Args:
+            entries: List of entry dictionaries from the config.
+        """
+        app_dir = str(self.app_dir)
+        python_exec = self.config.python_executable
+        self._resolved_entries = []
+        for entry in entries:
+            script_path = entry.get("script_path", "")
+            working_dir = entry.get("working_dir", "")
+            if script_path and not _is_abs_path(script_path):
+                script_path = f"{app_dir}{os.sep}{script_path}"
+            if working_dir and not _is_abs_path(working_dir):
+                working_dir = f"{app_dir}{os.sep}{working_dir}"
+
+            # Pre-build the launch argv so clicking skips shlex parsing
+            argv = [entry.get("interpreter") or python_exec, script_path]
+            args = entry.get("args", "")
+            if args:
+                try:
+                    argv.extend(shlex.split(args))
+                except ValueError:
+                    # Unbalanced quoting; degrade to whitespace splitting
+                    argv.extend(args.split())
+
+            self._resolved_entries.append(
+                {**entry, "_abs_script": script_path, "_abs_cwd": working_dir,
+                 "_argv": argv}
             )
-            btn.pack(side=tk.LEFT, padx=5)
-            self.entry_buttons.append(btn)
 
     def _on_entry_click(self, index: int) -> None:
         """Handle entry button click.
@@ -160,60 +296,95 @@ class LauncherApp:
         Args:
             index: Index of the entry in the config.
         """
-        entries = self.config.entries
+        entries = self._resolved_entries
         if index >= len(entries):
             return
 
         entry = entries[index]
-        script_path = entry.get("script_path", "")
-        working_dir = entry.get("working_dir", "")
-        args = entry.get("args", "")
+        script_path = entry["_abs_script"]
+        working_dir = entry["_abs_cwd"]
         name = entry.get("name", f"Entry {index+1}")
 
-        # Resolve relative paths
-        app_dir = get_app_dir()
-        if script_path and not os.path.isabs(script_path):
-            script_path = str(app_dir / script_path)
-        if working_dir and not os.path.isabs(working_dir):
-            working_dir = str(app_dir / working_dir)
-
-        if script_path and self.runner.start(script_path, cwd=working_dir if working_dir else None, args=args):
+        if script_path and self.runner.start(script_path, cwd=working_dir if working_dir else None, argv=entry["_argv"]):
             self.current_script = name
-            self.status_label.config(text=f"Status: Uruchomiono {name}...")
-            self._set_buttons_state(tk.DISABLED)
-            self.btn_stop.config(state=tk.NORMAL)
-            self._append_to_log(f"\n{LOG_SEPARATOR}\nUruchamianie {name}...\n{LOG_SEPARATOR}\n")
+            self.status_var.set(f"Status: Uruchomiono {name}...")
+            self._set_running(True)
+            self._append_to_log(_START_HEADER.format(name=name))
+            # Leave any pending slow-cadence tick behind and poll at once.
+            if self._after_id is not None:
+                self.root.after_cancel(self._after_id)
+            self._after_id = self.root.after(0, self._update)
 
-    def _set_buttons_state(self, state) -> None:
-        """Set state for all entry buttons.
+    def _set_running(self, running: bool) -> None:
+        """Apply the running/idle state to all runtime buttons in one pass.
 
         Args:
-            state: The button state (tk.NORMAL or tk.DISABLED).
+            running: True while a script is executing.
         """
+        entry_state = ["disabled"] if running else ["!disabled"]
+        stop_state = ["!disabled"] if running else ["disabled"]
         for btn in self.entry_buttons:
-            btn.config(state=state)
+            btn.state(entry_state)
+        self.btn_stop.state(stop_state)
 
     def _start_update_loop(self) -> None:
-        """Start the update loop to check process output."""
+        """Start the watchdog loop that tracks process state."""
         self._update()
 
+    def _notify_log_data(self) -> None:
+        """Signal the Tk thread that new output is available.
+
+        Called from a background reader thread; event_generate is one of
+        the few Tk entry points that is safe to call across threads.
+        """
+        try:
+            self.root.event_generate("<<LogData>>", when="tail")
+        except tk.TclError:
+            # Window is being torn down
+            pass
+
+    def _flush_log(self, event=None) -> None:
+        """Drain all pending runner output into the log widget.
+
+        Args:
+            event: The <<LogData>> virtual event (unused).
+        """
+        output = self.runner.drain_output()
+        if output:
+            self._append_to_log(output)
+
+        # Flush at most one deferred autoscroll per batch.
+        if self._scroll_pending:
+            self._scroll_pending = False
+            self.log_text.see(tk.END)
+
     def _update(self) -> None:
-        """Update the log with process output and check process status."""
-        # Update log with process output
-        if self.runner.is_running:
-            output = self.runner.get_output()
-            if output:
-                self._append_to_log(output)
-
-        # Check if process finished
-        if self.current_script and not self.runner.is_running:
-            self.status_label.config(text=f"Status: {self.current_script} zakończone")
-            self._set_buttons_state(tk.NORMAL)
-            self.btn_stop.config(state=tk.DISABLED)
+        """Watchdog loop: track process state and stale-widget catch-up.
+
+        Output delivery itself is event-driven: the multiplexer thread
+        fires <<LogData>> whenever the child writes.
+        """
+        # One process check per tick: is_running costs a waitpid poll, so
+        # both the exit check and the delay choice share this snapshot.
+        running = self.runner.is_running
+
+        # Check if process finished; pick up any output that raced the exit.
+        if self.current_script and not running:
+            self._flush_log()
+            self.status_var.set(f"Status: {self.current_script} zakończone")
+            self._set_running(False)
             self.current_script = None
 
-        # Schedule next update using after() directly
-        self.root.after(100, self._update)
+        # Catch the widget up from the ring buffer once the tail is
+        # visible again after a stale period.
+        if (self._widget_stale and self.root.state() != "iconic"
+                and self.log_text.winfo_viewable()
+                and self.log_text.yview()[1] >= 1.0):
+            self._widget_stale = False
+            self._update_log_display()
+
+        delay = self._ACTIVE_POLL_MS if running else self._IDLE_POLL_MS
+        self._after_id = self.root.after(delay, self._update)
 
     def _append_to_log(self, text: str) -> None:
         """Append text to the log widget efficiently.
@@ -221,26 +392,64 @@ class LauncherApp:
         Args:
             text: The text to append to the log.
         """
-        self.log_content += text
-        # Limit log size
-        lines = self.log_content.split("\n")
-        max_lines = self.config.get("log_max_lines", 1000)
-        if len(lines) > max_lines:
-            self.log_content = "\n".join(lines[-max_lines:])
-            # Full refresh needed when truncating
-            self._update_log_display()
+        # Fast path: a chunk with no newline only grows the partial line, so
+        # skip the split and eviction bookkeeping entirely.
+        new_lines = text.count("\n")
+        if not new_lines:
+            self._log_partial += text
         else:
-            # Efficient append - only add new content
-            self.log_text.config(state=tk.NORMAL)
-            self.log_text.insert(tk.END, text)
-            self.log_text.see(tk.END)
-            self.log_text.config(state=tk.DISABLED)
+            # Fold the new chunk into the line ring buffer; the last element
+            # of the split is the (possibly empty) unfinished line.
+            buffered = self._log_partial + text
+            complete_lines = buffered.split("\n")
+            self._log_partial = complete_lines.pop()
+            self._log_lines.extend(complete_lines)
+
+        # Efficient append - trim the evicted prefix in one line-based range
+        # delete and only insert the new chunk; never rewrite the whole
+        # widget here. _displayed_lines tracks the widget's newline count.
+        # Only autoscroll when the user was already at the bottom, and defer
+        # the actual see(END) to the update tick so bursts of chunks cost a
+        # single scroll computation.
+        at_bottom = self.log_text.yview()[1] >= 1.0
+
+        # While the widget is hidden (window iconified or unmapped) or the
+        # user is reading history, skip the widget work entirely; the ring
+        # buffer keeps the data and the widget is refreshed in one pass
+        # when the tail is visible again.
+        if (self.root.state() == "iconic" or not self.log_text.winfo_viewable()
+                or not at_bottom):
+            self._widget_stale = True
+            return
+
+        self.log_text.config(state=tk.NORMAL)
+        self._displayed_lines += new_lines
+        evicted = self._displayed_lines - self._log_max_lines
+        if evicted > 0:
+            self.log_text.delete("1.0", f"{evicted + 1}.0")
+            self._displayed_lines -= evicted
+        self.log_text.insert(tk.END, text)
+        self.log_text.config(state=tk.DISABLED)
+
+        if at_bottom:
+            self._scroll_pending = True
+
+    def _on_log_visible(self, event=None) -> None:
+        """Flush buffered log lines when the widget becomes visible again."""
+        if self._widget_stale:
+            self._widget_stale = False
+            self._update_log_display()
 
     def _update_log_display(self) -> None:
-        """Update the log text widget with full content refresh."""
+        """Update the log text widget with a full refresh from the buffer."""
+        content = "\n".join(self._log_lines)
+        if self._log_lines:
+            content += "\n"
+        content += self._log_partial
+        self._displayed_lines = content.count("\n")
         self.log_text.config(state=tk.NORMAL)
         self.log_text.delete(1.0, tk.END)
-        self.log_text.insert(tk.END, self.log_content)
+        self.log_text.insert(tk.END, content)
         self.log_text.see(tk.END)
         self.log_text.config(state=tk.DISABLED)
 
@@ -248,40 +457,57 @@ class LauncherApp:
         """Handle Stop button click."""
         if self.runner.is_running:
             self.runner.stop()
-            self._append_to_log(f"\n[ZATRZYMANO] {self.current_script} zostało zatrzymane przez użytkownika.\n")
-            self.status_label.config(text="Status: Zatrzymano")
-            self._set_buttons_state(tk.NORMAL)
-            self.btn_stop.config(state=tk.DISABLED)
+            self._append_to_log(_STOP_LINE.format(name=self.current_script))
+            self.status_var.set("Status: Zatrzymano")
+            self._set_running(False)
             self.current_script = None
 
     def _on_clear(self) -> None:
         """Handle Clear Log button click."""
-        self.log_content = ""
+        self._log_lines.clear()
+        self._log_partial = ""
         self._update_log_display()
 
     def _on_config(self) -> None:
         """Handle Configuration button click."""
-        ConfigWindow(self.root, self.config, self._refresh_entry_buttons)
+        ConfigWindow(self.root, self.config, self._on_config_changed,
+                     app_dir=self.app_dir)
+
+    def _on_config_changed(self) -> None:
+        """Refresh cached settings and widgets after a config change."""
+        self._refresh_log_settings()
+        self._refresh_entry_buttons()
+
+    def _refresh_log_settings(self) -> None:
+        """Re-read the cached log line limit, resizing the ring buffer."""
+        max_lines = self.config.get("log_max_lines", 1000)
+        if max_lines != self._log_max_lines:
+            self._log_max_lines = max_lines
+            self._log_lines = collections.deque(self._log_lines, maxlen=max_lines)
 
     def _on_close(self) -> None:
         """Handle window close event."""
         self.runner.stop()
+        self.config.flush()
         self.root.destroy()
 
 
 class ConfigWindow:
     """Configuration window dialog."""
 
-    def __init__(self, parent: tk.Tk, config: ConfigManager, on_refresh_callback=None):
+    def __init__(self, parent: tk.Tk, config: ConfigManager, on_refresh_callback=None,
+                 app_dir: Path = None):
         """Initialize the configuration window.
 
         Args:
             parent: The parent window.
             config: The configuration manager instance.
             on_refresh_callback: Callback to refresh main window buttons.
+            app_dir: Application directory (resolved once by the caller).
         """
         self.config = config
         self.on_refresh_callback = on_refresh_callback
+        self.app_dir = app_dir if app_dir is not None else get_app_dir()
 
         self.window = tk.Toplevel(parent)
         self.window.title("Konfiguracja")
@@ -379,7 +605,7 @@ class ConfigWindow:
 
     def _on_add_entry(self) -> None:
         """Handle Add Entry button click."""
-        dialog = EntryDialog(self.window, self.config)
+        dialog = EntryDialog(self.window, self.config, app_dir=self.app_dir)
         self.window.wait_window(dialog.window)
         if dialog.result:
             self.config.add_entry(**dialog.result)
@@ -400,7 +626,7 @@ class ConfigWindow:
             return
 
         entry = entries[index]
-        dialog = EntryDialog(self.window, self.config, entry)
+        dialog = EntryDialog(self.window, self.config, entry, app_dir=self.app_dir)
         self.window.wait_window(dialog.window)
         if dialog.result:
             self.config.update_entry(index, **dialog.result)
@@ -442,17 +668,19 @@ class ConfigWindow:
 class EntryDialog:
     """Dialog for adding or editing a menu entry."""
 
-    def __init__(self, parent, config: ConfigManager, entry: dict = None):
+    def __init__(self, parent, config: ConfigManager, entry: dict = None,
+                 app_dir: Path = None):
         """Initialize the entry dialog.
 
         Args:
             parent: The parent window.
             config: The configuration manager instance.
             entry: Existing entry to edit (None for new entry).
+            app_dir: Application directory (resolved once by the caller).
         """
         self.config = config
         self.result = None
-        self.app_dir = get_app_dir()
+        self.app_dir = app_dir if app_dir is not None else get_app_dir()
         self.last_browse_dir = str(self.app_dir)
         self.entry = entry  # Store original entry for editing
 
@@ -1,12 +1,42 @@
 """Configuration manager module for the launcher application."""
 
+import copy
 import json
 import os
+import queue
 import tempfile
+import threading
 from pathlib import Path
 from typing import List, Optional
 
 
+# Reusable encoder for config serialization; iterencode streams chunks
+# instead of building the whole document in memory first.
+_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+# Canonical key order for menu entries so serialized configs keep a
+# stable, predictable layout.
+ENTRY_KEYS = ("id", "name", "script_path", "working_dir", "interpreter",
+              "args", "save_relative", "show_console", "enabled", "cwd_flag")
+
+
+def _build_entry(values: dict) -> dict:
+    """Build an entry dict with canonical key order.
+
+    Args:
+        values: Mapping of entry field names to values.
+
+    Returns:
+        Entry dictionary with known keys first, in ENTRY_KEYS order,
+        followed by any additional fields.
+    """
+    entry = {key: values[key] for key in ENTRY_KEYS if key in values}
+    for key, value in values.items():
+        if key not in entry:
+            entry[key] = value
+    return entry
+
+
 def get_app_dir() -> Path:
     """Get the application directory (where app.py resides).
 
@@ -27,15 +57,24 @@ class ConfigManager:
         """
         self.config_path = Path(config_path)
         self._config = {}
+        self._saved_hash = None
+        self._dir_ok = False
+        # Single-slot mailbox for the background writer; only the most
+        # recent state is ever written, so bursts of edits coalesce.
+        self._save_queue: Optional[queue.Queue] = None
+        self._writer_thread: Optional[threading.Thread] = None
         self._ensure_config_exists()
         self.load()
 
     def _ensure_config_exists(self) -> None:
         """Ensure the configuration file exists, creating it if missing."""
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
+        self._dir_ok = True
         if not self.config_path.exists():
             self._config = self._get_default_config()
-            self.save()
+            # Synchronous write: load() reads the file right after this.
+            self._write_config(self._config)
+            self._saved_hash = self._config_hash()
 
     def _get_default_config(self) -> dict:
         """Return the default configuration.
@@ -80,29 +119,125 @@ class ConfigManager:
         except (json.JSONDecodeError, FileNotFoundError):
             self._config = self._get_default_config()
             self.save()
+        self._saved_hash = self._config_hash()
+        self._refresh_cache()
         return self._config
 
-    def save(self) -> None:
-        """Save current configuration to the JSON file atomically."""
-        self.config_path.parent.mkdir(parents=True, exist_ok=True)
-        
+    def _config_hash(self) -> int:
+        """Return a hash of the current configuration state.
+
+        Returns:
+            Hash of the canonically serialized configuration.
+        """
+        return hash(json.dumps(self._config, sort_keys=True, ensure_ascii=False))
+
+    def _refresh_cache(self) -> None:
+        """Cache frequently accessed config sections as plain attributes."""
+        self._scripts = self._config.get("scripts", {})
+        self._python_executable = self._config.get("python_executable", "python")
+        # setdefault keeps the cached list and the stored config aliased,
+        # so entry mutations stay in sync without re-reading.
+        self._entries = self._config.setdefault("entries", [])
+        # Resolve script paths against the app dir once at load time so
+        # callers need no per-launch path munging or stat calls.
+        app_dir = get_app_dir()
+        self._scripts_resolved = {
+            name: (app_dir / path).resolve()
+            for name, path in self._scripts.items()
+        }
+
+    def save(self, force: bool = False) -> None:
+        """Queue the current configuration for an atomic background save.
+
+        Skips the write entirely when the configuration has not changed
+        since the last save or load. Bursts of edits coalesce: the writer
+        thread only ever persists the most recently queued state, so the
+        UI never waits on disk latency.
+
+        Args:
+            force: Write even if the configuration appears unchanged.
+        """
+        current_hash = self._config_hash()
+        if not force and current_hash == self._saved_hash:
+            return
+        self._saved_hash = current_hash
+
+        if self._save_queue is None:
+            self._save_queue = queue.Queue(maxsize=1)
+            self._writer_thread = threading.Thread(
+                target=self._writer_loop, daemon=True
+            )
+            self._writer_thread.start()
+
+        # Replace any still-queued state; only the latest matters.
+        try:
+            self._save_queue.get_nowait()
+            self._save_queue.task_done()
+        except queue.Empty:
+            pass
+        self._save_queue.put(copy.deepcopy(self._config))
+
+    def flush(self) -> None:
+        """Block until any queued save has reached disk."""
+        if self._save_queue is not None:
+            self._save_queue.join()
+
+    def _writer_loop(self) -> None:
+        """Background worker that persists queued configuration states."""
+        while True:
+            state = self._save_queue.get()
+            try:
+                self._write_config(state)
+            except Exception:
+                # Forget the optimistic hash so the next save() writes
+                # again instead of skipping as a no-op, and swallow
+                # everything: an escaping exception would kill the
+                # writer and leave flush() joining a queue that never
+                # drains.
+                self._saved_hash = None
+            finally:
+                self._save_queue.task_done()
+
+    def _write_config(self, config: dict) -> None:
+        """Write a configuration dict to the JSON file atomically.
+
+        Args:
+            config: The configuration state to persist.
+        """
+        # The directory is verified once; skip the mkdir syscall afterwards.
+        if not self._dir_ok:
+            self.config_path.parent.mkdir(parents=True, exist_ok=True)
+            self._dir_ok = True
+
         # Write to a temporary file first, then rename for atomic save
         temp_fd, temp_path = tempfile.mkstemp(
             dir=self.config_path.parent,
             prefix=".config_",
             suffix=".tmp"
         )
-        
+
         try:
             # Set secure permissions (read/write for owner only)
             os.chmod(temp_path, 0o600)
-            
-            with os.fdopen(temp_fd, "w", encoding="utf-8") as f:
-                json.dump(self._config, f, indent=2, ensure_ascii=False)
-            
+
+            # Stream encoder chunks to the raw fd, batching into 64 KiB
+            # writes; peak memory stays at buffer size instead of the
+            # whole serialized document.
+            try:
+                buf = bytearray()
+                for chunk in _ENCODER.iterencode(config):
+                    buf += chunk.encode("utf-8")
+                    if len(buf) >= 65536:
+                        os.write(temp_fd, buf)
+                        buf.clear()
+                if buf:
+                    os.write(temp_fd, buf)
+            finally:
+                os.close(temp_fd)
+
             # Atomic rename (on most systems)
             os.replace(temp_path, self.config_path)
-        except (IOError, OSError, json.JSONEncodeError) as e:
+        except (IOError, OSError):
             # Clean up temp file if save failed
             try:
                 os.remove(temp_path)
@@ -130,6 +265,7 @@ class ConfigManager:
             value: The value to set.
         """
         self._config[key] = value
+        self._refresh_cache()
 
     @property
     def scripts(self) -> dict:
@@ -138,7 +274,16 @@ class ConfigManager:
         Returns:
             Dictionary mapping script names to their paths.
         """
-        return self._config.get("scripts", {})
+        return self._scripts
+
+    @property
+    def scripts_resolved(self) -> dict:
+        """Get the scripts configuration with absolute, resolved paths.
+
+        Returns:
+            Dictionary mapping script names to resolved Path objects.
+        """
+        return self._scripts_resolved
 
     @property
     def python_executable(self) -> str:
@@ -147,7 +292,7 @@ class ConfigManager:
         Returns:
             Path to the Python executable.
         """
-        return self._config.get("python_executable", "python")
+        return self._python_executable
 
     @property
     def entries(self) -> List[dict]:
@@ -156,7 +301,7 @@ class ConfigManager:
         Returns:
             List of entry dictionaries.
         """
-        return self._config.get("entries", [])
+        return self._entries
 
     def add_entry(self, name: str, script_path: str, working_dir: str = "",
                   interpreter: str = "", args: str = "", save_relative: bool = True,
@@ -179,7 +324,7 @@ class ConfigManager:
         if "entries" not in self._config:
             self._config["entries"] = []
 
-        entry = {
+        entry = _build_entry({
             "name": name,
             "script_path": script_path,
             "working_dir": working_dir,
@@ -188,10 +333,9 @@ class ConfigManager:
             "save_relative": save_relative,
             "show_console": show_console,
             "enabled": enabled,
-            "cwd_flag": cwd_flag
-        }
-        # Add any additional fields from kwargs
-        entry.update(kwargs)
+            "cwd_flag": cwd_flag,
+            **kwargs
+        })
         self._config["entries"].append(entry)
         self.save()
 
@@ -223,10 +367,7 @@ class ConfigManager:
 
         entries = self._config["entries"]
         if 0 <= index < len(entries):
-            # Preserve existing id if present
-            existing_id = entries[index].get("id")
-            
-            entry = {
+            values = {
                 "name": name,
                 "script_path": script_path,
                 "working_dir": working_dir,
@@ -235,21 +376,16 @@ class ConfigManager:
                 "save_relative": save_relative,
                 "show_console": show_console,
                 "enabled": enabled,
-                "cwd_flag": cwd_flag
+                "cwd_flag": cwd_flag,
+                **kwargs
             }
-            
-            # Preserve id if it existed
+
+            # Preserve existing id if present
+            existing_id = entries[index].get("id")
             if existing_id is not None:
-                entry["id"] = existing_id
-            elif "id" in kwargs:
-                entry["id"] = kwargs["id"]
-                
-            # Add any additional fields from kwargs (except id which was handled)
-            for key, value in kwargs.items():
-                if key != "id":
-                    entry[key] = value
-                    
-            entries[index] = entry
+                values["id"] = existing_id
+
+            entries[index] = _build_entry(values)
             self.save()
             return True
         return False
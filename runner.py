@@ -1,49 +1,184 @@
 """Process runner module for executing Python scripts."""
 
+import collections
+import functools
+import os
+import selectors
 import shlex
+import signal
 import subprocess
 import threading
-import queue
+import time
+import weakref
 from pathlib import Path
 from typing import Optional
 
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_args(args: str) -> tuple:
+    """Split an argument string with shell quoting, cached per string.
+
+    Relaunching the same entry re-parses the same args every time; the
+    cache makes repeat launches allocation-free.
+
+    Args:
+        args: The raw argument string.
+
+    Returns:
+        Tuple of parsed argument tokens.
+    """
+    return tuple(shlex.split(args))
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_script(path: str, _ttl_bucket: int):
+    """Resolve a script path and stat it, cached for about a second.
+
+    Args:
+        path: The script path as given by the caller.
+        _ttl_bucket: Current second; bumps the cache key so entries
+            expire instead of serving stale existence results forever.
+
+    Returns:
+        Tuple of (resolved Path, True if the file exists).
+    """
+    script = Path(path).resolve()
+    return script, script.exists()
+
+
+class _Multiplexer:
+    """One selector and one thread shared by every ProcessRunner.
+
+    However many scripts are running, a single background thread watches
+    all of their stdout pipes and dispatches readable fds to the owning
+    runner's callback. The thread starts lazily on first registration
+    and idles on a short select timeout so new pipes get picked up.
+    """
+
+    def __init__(self):
+        self._selector = selectors.DefaultSelector()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def register(self, fd: int, callback) -> None:
+        """Watch a pipe fd, invoking callback when it becomes readable.
+
+        The callback is held weakly so a registration never keeps its
+        runner alive; a dead runner's fd is dropped on next dispatch.
+
+        Args:
+            fd: The file descriptor to watch.
+            callback: Zero-argument bound method run on the selector thread.
+        """
+        with self._lock:
+            self._selector.register(
+                fd, selectors.EVENT_READ, weakref.WeakMethod(callback)
+            )
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, daemon=True)
+                self._thread.start()
+
+    def unregister(self, fd: int) -> None:
+        """Stop watching a pipe fd.
+
+        Args:
+            fd: The file descriptor to drop.
+        """
+        with self._lock:
+            try:
+                self._selector.unregister(fd)
+            except (KeyError, OSError):
+                pass
+
+    def _loop(self) -> None:
+        """Selector thread body: dispatch readable fds to their runners."""
+        while True:
+            try:
+                events = self._selector.select(timeout=0.1)
+            except OSError:
+                events = []
+            for key, _ in events:
+                callback = key.data()
+                if callback is None:
+                    self.unregister(key.fd)
+                else:
+                    callback()
+
+
+# Shared by all runners; the selector thread only starts once a script runs.
+_multiplexer = _Multiplexer()
+
 
 class ProcessRunner:
     """Runs Python scripts as subprocesses with output streaming."""
 
-    def __init__(self, python_executable: str = "python"):
+    def __init__(self, python_executable: str = "python", on_data=None):
         """Initialize the ProcessRunner.
 
         Args:
             python_executable: Path to the Python executable.
+            on_data: Optional callable invoked (from the reader thread)
+                whenever new output is available.
         """
         self.python_executable = python_executable
+        self._on_data = on_data
         self._process: Optional[subprocess.Popen] = None
-        self._output_queue: queue.Queue = queue.Queue()
+        # Single-producer/single-consumer chunk queue. deque.append and
+        # popleft are atomic under the GIL, so neither side needs a lock.
+        self._chunks = collections.deque()
+        # Reusable read buffer so the drain path allocates nothing per
+        # read; the kernel copies straight into it via os.readv. At
+        # 64 KiB it dominates an idle runner's footprint, so it is only
+        # allocated once a script actually starts.
+        self._read_buf: Optional[bytearray] = None
+        self._read_mv: Optional[memoryview] = None
+        # On POSIX the pipe is served by the shared multiplexer thread;
+        # elsewhere a per-runner reader thread does blocking reads.
+        self._pipe_fd: Optional[int] = None
         self._reader_thread: Optional[threading.Thread] = None
-        self._running = False
+        # Set once the child's output pipe reaches EOF; lets callers
+        # distinguish "exited" from "exited but output still buffered".
+        self._done = threading.Event()
         self._lock = threading.Lock()
+        # Safety net for runners dropped without stop(): a finalizer
+        # outlives self without resurrecting it and, unlike __del__,
+        # never blocks garbage collection on a process wait.
+        self._process_ref = [None]
+        self._finalizer = weakref.finalize(
+            self, ProcessRunner._finalize_process, self._process_ref
+        )
 
     @property
     def is_running(self) -> bool:
         """Check if a process is currently running.
 
+        Lock-free: ``_process`` is only ever assigned in start() and
+        cleared in stop(), and attribute reads are atomic under the GIL,
+        so the UI's frequent polls never touch the buffer lock.
+
         Returns:
             True if a process is running, False otherwise.
         """
-        with self._lock:
-            process = self._process
-        if process is None:
-            return False
-        return process.poll() is None
+        process = self._process
+        return process is not None and process.poll() is None
 
-    def start(self, script_path: str, cwd: str = None, args: str = "") -> bool:
+    def start(self, script_path, cwd: str = None, args: str = "",
+              check_exists: bool = True, argv: list = None) -> bool:
         """Start a Python script as a subprocess.
 
         Args:
-            script_path: Path to the Python script to run.
+            script_path: Path to the Python script to run (str or Path).
             cwd: Working directory for the process (optional).
             args: Command line arguments (optional).
+            check_exists: Skip the existence stat when the caller already
+                verified the path.
+            argv: Pre-built command list; when given, overrides the
+                interpreter/script/args assembly.
 
         Returns:
             True if the script was started successfully, False otherwise.
@@ -51,80 +186,259 @@ class ProcessRunner:
         if self.is_running:
             return False
 
-        script = Path(script_path)
-        if not script.exists():
-            self._output_queue.put(f"Error: Script not found: {script_path}\n")
+        script, exists = _resolve_script(str(script_path), int(time.monotonic()))
+        if check_exists and not exists:
+            self._push_message(f"Error: Script not found: {script_path}\n")
             return False
 
         # Determine working directory
         working_dir = cwd if cwd else str(script.parent)
 
-        # Build command with optional arguments
-        cmd = [self.python_executable, str(script)]
-        if args:
-            cmd.extend(shlex.split(args))
+        # Build command with optional arguments (unless pre-built)
+        if argv is not None:
+            cmd = list(argv)
+        else:
+            cmd = [self.python_executable, "-u", str(script)]
+            if args:
+                cmd.extend(_parse_args(args))
+
+        # Put the child in its own process group so stop() can signal any
+        # grandchildren it spawned as well.
+        if os.name == "posix":
+            # close_fds=False skips the O(max fd) close loop at spawn
+            # time; safe because Python-created fds (pipes, selector,
+            # temp files) are non-inheritable by default per PEP 446.
+            group_kwargs = {"start_new_session": True, "close_fds": False}
+        else:
+            group_kwargs = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
 
         try:
             self._process = subprocess.Popen(
                 cmd,
+                # Give the child its own stdin pipe: it sees EOF when the
+                # launcher exits instead of inheriting whatever fd the
+                # launcher happened to start with (often /dev/null).
+                stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                cwd=working_dir
+                bufsize=65536,
+                cwd=working_dir,
+                # Unbuffered child stdout keeps streaming latency low
+                # without per-line flush calls in the scripts; this also
+                # covers pre-built argv commands.
+                env={**os.environ, "PYTHONUNBUFFERED": "1"},
+                **group_kwargs
             )
-            self._running = True
-            self._start_reader_thread()
+            self._process_ref[0] = self._process
+            self._done.clear()
+            if os.name == "posix":
+                fd = self._process.stdout.fileno()
+                os.set_blocking(fd, False)
+                # Grow the kernel pipe buffer (Linux only) so a bursty
+                # child is not write-blocked while the GUI has the GIL;
+                # failure just leaves the 64 KiB default.
+                if fcntl is not None and hasattr(fcntl, "F_SETPIPE_SZ"):
+                    try:
+                        fcntl.fcntl(fd, fcntl.F_SETPIPE_SZ, 1 << 20)
+                    except OSError:
+                        pass
+                if self._read_buf is None:
+                    self._read_buf = bytearray(65536)
+                    self._read_mv = memoryview(self._read_buf)
+                self._pipe_fd = fd
+                _multiplexer.register(fd, self._on_readable)
+            else:
+                # select() cannot watch pipes on Windows; fall back to a
+                # blocking reader thread there.
+                self._start_reader_thread()
             return True
         except Exception as e:
-            self._output_queue.put(f"Error starting script: {e}\n")
+            self._push_message(f"Error starting script: {e}\n")
             return False
 
+    def _push_message(self, text: str) -> None:
+        """Append a runner-generated message to the output buffer.
+
+        Args:
+            text: The message text to append.
+        """
+        self._chunks.append(text.encode("utf-8"))
+        if self._on_data:
+            self._on_data()
+
+    def _on_readable(self) -> None:
+        """Drain ready child output; runs on the multiplexer thread.
+
+        Reads the pipe until it would block, batching the whole burst
+        into one chunk append so consumers see at most one new deque
+        entry per select wakeup.
+        """
+        fd = self._pipe_fd
+        if fd is None:
+            return
+        burst = bytearray()
+        eof = False
+        while True:
+            try:
+                n = os.readv(fd, [self._read_buf])
+            except BlockingIOError:
+                break
+            except OSError:
+                eof = True
+                break
+            if not n:
+                eof = True
+                break
+            burst += self._read_mv[:n]
+        if burst:
+            self._chunks.append(bytes(burst))
+            if self._on_data:
+                self._on_data()
+        if eof:
+            self._close_pipe()
+
+    def _close_pipe(self) -> None:
+        """Unregister and close the child stdout pipe."""
+        if self._pipe_fd is not None:
+            _multiplexer.unregister(self._pipe_fd)
+            self._pipe_fd = None
+        process = self._process
+        if process is not None and process.stdout:
+            try:
+                process.stdout.close()
+            except OSError:
+                pass
+        self._done.set()
+
     def _start_reader_thread(self) -> None:
-        """Start a background thread to read process output."""
+        """Start a background thread to read process output (non-POSIX)."""
         def read_output():
             with self._lock:
                 process = self._process
             if process and process.stdout:
-                for line in process.stdout:
-                    self._output_queue.put(line)
-                process.stdout.close()
-            with self._lock:
-                self._running = False
+                fd = process.stdout.fileno()
+                # Watermark batching: buffer locally and publish when
+                # enough bytes or time have accumulated, so a chatty
+                # line-at-a-time child costs one deque append and one
+                # on_data per batch instead of per read.
+                local = bytearray()
+                last = time.monotonic()
+                while True:
+                    try:
+                        chunk = os.read(fd, 65536)
+                    except OSError:
+                        break
+                    if not chunk:
+                        break
+                    local += chunk
+                    now = time.monotonic()
+                    if len(local) >= 4096 or now - last > 0.05:
+                        self._chunks.append(bytes(local))
+                        local.clear()
+                        last = now
+                        if self._on_data:
+                            self._on_data()
+                if local:
+                    self._chunks.append(bytes(local))
+                    if self._on_data:
+                        self._on_data()
+                try:
+                    process.stdout.close()
+                except OSError:
+                    pass
+            self._done.set()
 
         self._reader_thread = threading.Thread(target=read_output, daemon=True)
         self._reader_thread.start()
 
+    @staticmethod
+    def _signal_group(process: subprocess.Popen, kill: bool = False) -> None:
+        """Terminate or kill the child's whole process group.
+
+        Falls back to signalling only the direct child where process
+        groups are unavailable.
+
+        Args:
+            process: The child process.
+            kill: Use SIGKILL instead of SIGTERM.
+        """
+        if os.name == "posix":
+            try:
+                os.killpg(process.pid, signal.SIGKILL if kill else signal.SIGTERM)
+                return
+            except (ProcessLookupError, PermissionError, OSError):
+                pass
+        if kill:
+            process.kill()
+        else:
+            process.terminate()
+
     def stop(self) -> None:
-        """Stop the running process."""
+        """Stop the running process and any children it spawned."""
         with self._lock:
             process = self._process
             if process is not None:
                 try:
-                    process.terminate()
+                    self._signal_group(process)
                     process.wait(timeout=5)
                 except subprocess.TimeoutExpired:
-                    process.kill()
+                    self._signal_group(process, kill=True)
                     process.wait()
                 finally:
+                    self._close_pipe()
                     self._process = None
-                    self._running = False
+                    self._process_ref[0] = None
 
-    def get_output(self) -> str:
-        """Get all available output from the process.
+    def drain_output_bytes(self) -> bytes:
+        """Drain every pending raw output chunk in a single call.
+
+        Pops chunks off the shared deque without locking; popleft is
+        atomic, so a concurrent producer append is never lost, merely
+        picked up by the next drain.
 
         Returns:
-            String containing all available output lines.
+            Bytes containing all pending output joined together.
         """
-        output_lines = []
+        # Common case: the UI polls and nothing is pending; answer with
+        # one truthiness check instead of entering the pop loop.
+        if not self._chunks:
+            return b""
+        chunks = []
+        pop = self._chunks.popleft
         while True:
             try:
-                line = self._output_queue.get_nowait()
-                output_lines.append(line)
-            except queue.Empty:
+                chunks.append(pop())
+            except IndexError:
                 break
-        return "".join(output_lines)
+        return b"".join(chunks)
+
+    def drain_output(self) -> str:
+        """Drain all pending output and decode it once at the boundary.
+
+        The newline translation the text-mode wrapper used to do happens
+        here too, over the whole batch instead of per line.
+
+        Returns:
+            String containing all pending output joined together.
+        """
+        out = self.drain_output_bytes().decode("utf-8", "replace")
+        return out.replace("\r\n", "\n") if "\r" in out else out
 
-    def __del__(self):
-        """Cleanup when the runner is destroyed."""
-        self.stop()
+    def get_output(self) -> str:
+        """Get all available output from the process.
+
+        Returns:
+            String containing all available output lines.
+        """
+        return self.drain_output()
+
+    @staticmethod
+    def _finalize_process(process_ref: list) -> None:
+        """Finalizer: signal any process left behind by a dropped runner.
+
+        Args:
+            process_ref: Single-element holder tracking the live process.
+        """
+        process = process_ref[0]
+        if process is not None and process.poll() is None:
+            ProcessRunner._signal_group(process)
@@ -1,7 +1,8 @@
 """Zlecenia (Orders) main script."""
 
-import time
+import selectors
 import sys
+import time
 
 
 def main():
@@ -11,13 +12,27 @@ def main():
     print("=" * 50)
     print()
 
+    # Wait on stdin instead of sleeping: the script wakes early if the
+    # parent writes or closes the pipe, and otherwise ticks every 2 s.
+    # Some stdins (e.g. /dev/null, a regular file) cannot be polled by
+    # epoll; fall back to a plain sleep there.
+    sel = selectors.DefaultSelector()
+    try:
+        sel.register(sys.stdin, selectors.EVENT_READ)
+    except (PermissionError, OSError, ValueError):
+        sel = None
+
     counter = 0
     try:
         while True:
             counter += 1
             print(f"[Zlecenia] Processing order batch #{counter}...")
-            sys.stdout.flush()
-            time.sleep(2)
+            if sel is None:
+                time.sleep(2)
+            elif sel.select(timeout=2.0):
+                if not sys.stdin.readline():
+                    # stdin reached EOF; the parent is gone.
+                    break
     except KeyboardInterrupt:
         print("\n[Zlecenia] Application stopped by user.")
 